@@ -1,12 +1,18 @@
 import asyncio
+import functools
+import hashlib
+import itertools
+import logging
+import random
 import re
+import string
+import sys
 from datetime import datetime, timezone
 import time
-from pathlib import Path
 
-from urllib.parse import urlparse
-import requests
-from bs4 import BeautifulSoup
+from urllib.parse import urljoin, urlparse
+import aiohttp
+from selectolax.lexbor import LexborHTMLParser
 
 import discord
 from discord.ext import tasks
@@ -14,37 +20,96 @@ from redbot.core import Config, checks, commands, data_manager
 from redbot.core.utils.predicates import ReactionPredicate
 from redbot.core.utils.menus import start_adding_reactions
 
+# CSS selectors shared by the two listing-page loops, defined once
+_SEL_MATCH_ITEM = 'a.wf-module-item.match-item'
+_SEL_STATUS = '.ml-status'
+_SEL_ETA = '.ml-eta'
+_SEL_TEAM = '.match-item-vs-team'
+_SEL_TEAM_NAME = '.match-item-vs-team-name'
+_SEL_TEAM_SCORE = '.match-item-vs-team-score'
+_SEL_EVENT = '.match-item-event'
+
+log = logging.getLogger("red.jdg-cogs.vlr")
+
+# VLR brand red, shared by every embed the cog sends
+_EMBED_COLOR = 0xff4654
+
+# Trophy placement around a spoilered scoreline, indexed by
+# (team_A_won << 1) | team_B_won so rendering needs no conditionals
+_TROPHY = '\N{TROPHY}'
+_TROPHY_PRE = ('', '', _TROPHY + ' ', _TROPHY + ' ')
+_TROPHY_SUF = ('', ' ' + _TROPHY, '', ' ' + _TROPHY)
+
+# Single-pass tab removal for scraped text (C-level, no intermediate strings)
+_STRIP_TABS = str.maketrans('', '', '\t')
+# Same, but also folds newlines to spaces (match-page header text)
+_CLEAN_WS = str.maketrans({'\t': None, '\n': ' '})
+
+@functools.lru_cache(maxsize=64)
+def _compile_sub_patterns(sub_event):
+    """Compile event substrings into one alternation regex.
+
+    One C-level scan of the event string covers every subscribed pattern,
+    instead of a Python-level substring check per subscription. Cached per
+    subscription tuple, so it only recompiles when subs actually change.
+    """
+    if not sub_event:
+        return None
+    return re.compile('|'.join(re.escape(se) for se in sub_event))
+
+# Failed listing fetch, as opposed to None for a 304/unchanged body; only
+# the latter revalidates the cache and may re-stamp its age
+_FETCH_FAILED = object()
+
+# Command category -> event substring filter; "Valorant" means everything,
+# so it carries no entry here. New categories only need a line in this table
+_CATEGORY_FILTERS = {
+    'VCT': 'Champions Tour',
+    'Game Changers': 'Game Changers'
+}
+
+# ETA strings look like "1d 2h", "1h 30m", "30m"
+_ETA_RE = re.compile(r'(\d+)([dhm])')
+_ETA_UNITS = {'d': 24 * 60, 'h': 60, 'm': 1}
+
+@functools.lru_cache(maxsize=256)
 def str_to_min(time_str):
     """ Parsing match time info from VLR's status string"""
-    total_minutes = 0
-    
     if time_str is None:
-        return total_minutes
-
-    parts = time_str.split()
-    for part in parts:
-        if 'd' in part:
-            days = int(part.replace('d', ''))
-            total_minutes += days * 24 * 60  # Convert days to minutes
-        elif 'h' in part:
-            hours = int(part.replace('h', ''))
-            total_minutes += hours * 60  # Convert hours to minutes
-        elif 'm' in part:
-            minutes = int(part.replace('m', ''))
-            total_minutes += minutes
-            
-    return total_minutes
+        return 0
+
+    return sum(int(n) * _ETA_UNITS[u] for n, u in _ETA_RE.findall(time_str))
+
+# Every two-letter code -> regional indicator pair, built once at import
+# (676 entries). Magic number 127397 offsets 'A' to the regional indicator A.
+_FLAG_TABLE = {
+    a + b: chr(ord(a) + 127397) + chr(ord(b) + 127397)
+    for a, b in itertools.product(string.ascii_uppercase, repeat=2)
+}
 
 def get_flag_unicode(flag_str):
-    """ Getting the actual flag unicode from country code. Magic number."""
-    country_code = flag_str.split('-')[-1].upper()
-    flag_unicode = ''.join(chr(ord(letter) + 127397) for letter in country_code)
-    
-    return flag_unicode
+    """ Getting the actual flag unicode from country code. Table lookup."""
+    return _FLAG_TABLE.get(flag_str.rpartition('-')[2].upper(), '')
+
+def matchup_line(match):
+    """ Matchup string for a listing row.
+
+    Precomputed at parse time; the fallback only fires for cached rows
+    persisted before precomputation existed.
+    """
+    line = match.get('matchup')
+    if line is None:
+        team_A, team_B = match['teams']
+        line = f"{team_A['flag']} {team_A['name']} vs. {team_B['flag']} {team_B['name']}"
+    return line
+
+# Match URLs have an integer as the first path component
+# (e.g. https://www.vlr.gg/303087/...) instead of /event or /team
+_MATCH_URL_RE = re.compile(r'^https?://[^/]+/\d+(?:/|$)')
 
 def validate_match_url(url):
     """ VLR match URLs - match URLs have an integer as the second part of the path (e.g. https://www.vlr.gg/303087/) instead of /event or /team"""
-    return Path(url).parts[2].isdigit()
+    return _MATCH_URL_RE.match(url) is not None
 
 def validate_url(url):
     """ Check if the URL is valid and well-formed."""
@@ -65,10 +130,68 @@ class VLR(commands.Cog):
         self.POLLING_RATE = 300 # global polling rate in seconds
         self.BASE_URL = "https://www.vlr.gg"
 
+        # Shared HTTP session so the event loop isn't blocked and TCP/TLS
+        # connections are reused across polls
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=10, keepalive_timeout=60),
+            timeout=aiohttp.ClientTimeout(total=30, connect=10),
+            headers={'User-Agent': 'JDG-Cogs-V3 VLR cog (Red-DiscordBot)'}
+        )
+        # Bound concurrent match-page scrapes so we don't hammer vlr.gg
+        self._scrape_sem = asyncio.Semaphore(5)
+
+        # Serialize cold-path refreshes so concurrent commands on an empty
+        # cache trigger one scrape, not one each
+        self._refresh_lock = asyncio.Lock()
+
+        # ETag/Last-Modified validators per listing URL for conditional GETs
+        self._http_validators = {}
+
+        # Resolved notification channel objects keyed by channel ID; evicted
+        # by the channel-delete listener below
+        self._channel_cache = {}
+
+        # vc_enabled flag per guild ID; written through by the enable/disable
+        # commands so notification sends skip the config read
+        self._vc_enabled_cache = {}
+
+        # In-memory TTL cache of scraped match pages, keyed (url, status) so a
+        # transition to LIVE forces one re-scrape of the finalized page.
+        # Kept out of Config so cache churn never hits disk
+        self.MATCH_PAGE_TTL = 1800
+        self._match_page_cache = {}
+
+        # Rendered embed fields for the listing commands, keyed by match URL.
+        # Flags, names, and ETAs only change when the listing cache is
+        # replaced, so the caches are dropped on every refresh
+        self._match_field_cache = {}
+        self._result_field_cache = {}
+
+        # Listing caches pre-partitioned by command category, rebuilt on
+        # refresh so the list commands never filter per invocation
+        self._matches_by_cat = None
+        self._results_by_cat = None
+
+        # Epoch copy of cache_time; cache age becomes a float subtraction
+        # instead of ISO-8601 parsing on every listing command
+        self._cache_time_epoch = None
+
+        # In-memory copies of the listing caches; the notify/interval paths
+        # read these instead of deserializing the Config values every tick
+        self._match_cache_mem = None
+        self._result_cache_mem = None
+
+        # Consecutive polls where both listings answered 304/unavailable;
+        # lets the interval adaptation back off when nothing is changing
+        self._unchanged_polls = 0
+
+        # Matches further out than this (minutes) get a lightweight
+        # notification built from listing data, skipping the page scrape
+        self.DETAIL_LEAD = 5
+
         default_global = {
             'match_cache': [],      # Caches first page of upcoming matches each poll
             'result_cache': [],     # Caches first page of results each poll
-            'notify_cache': {},     # Caches full match data for notifications
             'cache_time': None      # Timestamps last cache update
         }
         self.config.register_global(**default_global)
@@ -94,7 +217,10 @@ class VLR(commands.Cog):
     def cog_unload(self):
         # Safe exit of task loop
         self.parse.cancel()
-        self.command_vlr_vc_disable()
+        # Session close is a coroutine, schedule it on the loop. Watch party
+        # VCs are left alone here; they persist in config and [p]vlr vc
+        # disable cleans them up on demand.
+        asyncio.create_task(self.session.close())
 
     @commands.group(name="vlr")
     async def command_vlr(self, ctx: commands.Context):
@@ -158,9 +284,9 @@ class VLR(commands.Cog):
             pred = ReactionPredicate.yes_or_no(msg, ctx.author)
             await ctx.bot.wait_for("reaction_add", check=pred)
             if pred.result is True:
-                # Unsubscribe
-                sub_event.remove(event)
-                await self.config.guild(ctx.guild).sub_event.set(sub_event)
+                # Unsubscribe; async with reads and writes in one transaction
+                async with self.config.guild(ctx.guild).sub_event() as sub_event:
+                    sub_event.remove(event)
                 await ctx.send(f"Unsubscribed from event. Remaining: {sub_event}")
             else:
                 # No change
@@ -172,9 +298,9 @@ class VLR(commands.Cog):
             pred = ReactionPredicate.yes_or_no(msg, ctx.author)
             await ctx.bot.wait_for("reaction_add", check=pred)
             if pred.result is True:
-                # Subscribe
-                sub_event.append(event)
-                await self.config.guild(ctx.guild).sub_event.set(sub_event)
+                # Subscribe; async with reads and writes in one transaction
+                async with self.config.guild(ctx.guild).sub_event() as sub_event:
+                    sub_event.append(event)
                 await ctx.send(f"Event subscription added: {sub_event}")
             else:
                 # No change
@@ -199,23 +325,23 @@ class VLR(commands.Cog):
             pred = ReactionPredicate.yes_or_no(msg, ctx.author)
             await ctx.bot.wait_for("reaction_add", check=pred)
             if pred.result is True:
-                # Unsubscribe
-                sub_team.remove(team)
-                self.config.guild(ctx.guild).sub_team.set(sub_event)
+                # Unsubscribe; async with reads and writes in one transaction
+                async with self.config.guild(ctx.guild).sub_team() as sub_team:
+                    sub_team.remove(team)
                 await ctx.send(f"Unsubscribed from team. Remaining: {sub_team}")
             else:
                 # No change
                 await ctx.send(f"Team subscriptions unchanged: {sub_team}")
         else:
             # Not already subscribed, ask if they want to subscribe
-            msg = await ctx.send(f"Subscribe to team \"{event}\"?")
+            msg = await ctx.send(f"Subscribe to team \"{team}\"?")
             start_adding_reactions(msg, ReactionPredicate.YES_OR_NO_EMOJIS)
             pred = ReactionPredicate.yes_or_no(msg, ctx.author)
             await ctx.bot.wait_for("reaction_add", check=pred)
             if pred.result is True:
-                # Subscribe
-                sub_team.append(team)
-                self.config.guild(ctx.guild).sub_team.set(sub_team)
+                # Subscribe; async with reads and writes in one transaction
+                async with self.config.guild(ctx.guild).sub_team() as sub_team:
+                    sub_team.append(team)
                 await ctx.send(f"Team subscription added: {sub_team}")
             else:
                 # No change
@@ -253,6 +379,7 @@ class VLR(commands.Cog):
 
         # Initialize config storage
         await self.config.guild(ctx.guild).vc_enabled.set(True)
+        self._vc_enabled_cache[ctx.guild.id] = True
         await self.config.guild(ctx.guild).vc_default.set(default_channel.id)
         
         # Create watch party category for VCs
@@ -279,20 +406,27 @@ class VLR(commands.Cog):
         vc_category = self.bot.get_channel(await self.config.guild(ctx.guild).vc_category())
         
         await self.config.guild(ctx.guild).vc_enabled.set(False)
+        self._vc_enabled_cache[ctx.guild.id] = False
 
         # Delete every watch party voice channel after moving everyone to the default channel
         async with self.config.guild(ctx.guild).vc_created() as vc_created:
+            move_coros = []
+            delete_coros = []
             for vc in vc_created:
                 this_channel = self.bot.get_channel(vc_created[vc])
                 if this_channel is None:
                     # Already deleted
                     continue
-                this_members = this_channel.members
-                for m in this_members:
-                    await m.move_to(default_channel)
-                
-                await this_channel.delete(reason="VLR VC Disabled")
-            
+                move_coros.extend(m.move_to(default_channel) for m in this_channel.members)
+                delete_coros.append(this_channel.delete(reason="VLR VC Disabled"))
+
+            # The REST calls are independent; overlap them, moves before
+            # deletes so nobody is left in a vanishing channel
+            if move_coros:
+                await asyncio.gather(*move_coros, return_exceptions=True)
+            if delete_coros:
+                await asyncio.gather(*delete_coros, return_exceptions=True)
+
             vc_created.clear()
         
         # Delete the category too
@@ -314,17 +448,19 @@ class VLR(commands.Cog):
             await ctx.send(f"{url} is not a valid VLR match URL")
 
         # Get HTML response
-        response = requests.get(url)
-        # Handle non-200 response
-        if response.status_code != 200:
-            await ctx.send(f"Error: {url} responded with {response.status_code}")
-            return
-        # Create soup
-        soup = BeautifulSoup(response.content, 'html.parser')
+        async with self.session.get(url) as response:
+            # Handle non-200 response
+            if response.status != 200:
+                await ctx.send(f"Error: {url} responded with {response.status}")
+                return
+            # lexbor takes the raw bytes directly, no intermediate str copy
+            body = await response.read()
+        # Parse off the event loop; only the two team names are needed
+        tree = await asyncio.to_thread(LexborHTMLParser, body)
 
         # Team information
-        team_A = soup.find(class_=["match-header-link-name mod-1"]).get_text(strip=True)
-        team_B = soup.find(class_=["match-header-link-name mod-2"]).get_text(strip=True)
+        team_A = tree.css_first('.match-header-link-name.mod-1').text(strip=True)
+        team_B = tree.css_first('.match-header-link-name.mod-2').text(strip=True)
         matchup_text = f"{'-'.join(team_A.split(' '))}-vs-{'-'.join(team_B.split(' '))}"
 
         # Create VC
@@ -369,178 +505,312 @@ class VLR(commands.Cog):
             if channel_id is not None:
                 channel_obj = self.bot.get_channel(channel_id)
                 if channel_obj is not None:
-                    # Move everyone to default channel
-                    if vc_default is not None:
-                        for m in channel_obj.members:
-                            await m.move_to(vc_default)
-                    
+                    # Move everyone to default channel; the moves are
+                    # independent REST calls, overlap them
+                    if vc_default is not None and channel_obj.members:
+                        await asyncio.gather(
+                            *(m.move_to(vc_default) for m in channel_obj.members),
+                            return_exceptions=True
+                        )
+
                     await channel_obj.delete(reason="Match Ended")
 
     #####################
     # Utility Functions #
     #####################
 
-    async def _getmatches(self):
-        """Parse matches from vlr"""
+    async def _vc_enabled(self, guild):
+        """ Cached vc_enabled flag, written through by the enable/disable commands """
+        enabled = self._vc_enabled_cache.get(guild.id)
+        if enabled is None:
+            enabled = await self.config.guild(guild).vc_enabled()
+            self._vc_enabled_cache[guild.id] = enabled
+        return enabled
+
+    def _conditional_headers(self, url):
+        """Build If-None-Match/If-Modified-Since headers from stored validators"""
+        validators = self._http_validators.get(url, {})
+        headers = {}
+        if validators.get('etag'):
+            headers['If-None-Match'] = validators['etag']
+        if validators.get('last_modified'):
+            headers['If-Modified-Since'] = validators['last_modified']
+        return headers
+
+    def _store_validators(self, url, response, body):
+        """Remember response validators so the next poll can be conditional
+
+        Returns True when the server offered no validators last time and the
+        body is byte-identical to the previous poll, i.e. the caller can skip
+        re-parsing exactly as it would on a 304.
+        """
+        prev = self._http_validators.get(url)
+        digest = hashlib.blake2b(body).digest()
+        self._http_validators[url] = {
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'body_hash': digest
+        }
+        return (
+            prev is not None
+            and not prev.get('etag') and not prev.get('last_modified')
+            and prev.get('body_hash') == digest
+        )
 
-        # Get HTML response for upcoming matches
-        url = "https://www.vlr.gg/matches"
-        response = requests.get(url)
-        # Handle non-200 response
-        if response.status_code != 200:
-            print(f"Error: {url} responded with {response.status_code}")
-            return
-        # Create Soup
-        soup = BeautifulSoup(response.content, 'html.parser')
+    def _parse_matches(self, body):
+        """ Pure sync parse of the upcoming-matches listing, safe for a thread """
 
-        # Find listed matches
-        matches = soup.find_all('a', class_=['wf-module-item', 'match-item'])
+        # Parse with selectolax (C-backed, much faster than bs4's html.parser)
+        tree = LexborHTMLParser(body)
 
         match_data = []
-        for match in matches:
+        for match in tree.css(_SEL_MATCH_ITEM):
             # Extract the URL to the individual match page
-            match_url = self.BASE_URL + match.get('href')
-            
+            match_url = self.BASE_URL + match.attributes.get('href')
+
             # Extract the time information
             # This is hard, webpage adjusts for local timezone, skip
-            #match_time = match.find(class_='match-item-time').get_text(strip=True)
-            
+            #match_time = match.css_first('.match-item-time').text(strip=True)
+
             # Check if the match is live or upcoming
-            live_or_upcoming = match.find(class_='ml-status').get_text(strip=True)
-            eta = match.find(class_='ml-eta')
-            eta = eta.get_text(strip=True) if eta else None
-            
+            live_or_upcoming = match.css_first(_SEL_STATUS).text(strip=True)
+            eta = match.css_first(_SEL_ETA)
+            eta = eta.text(strip=True) if eta else None
+
             # Extract participating teams and their flag emojis
-            teams = match.find_all(class_='match-item-vs-team')
+            teams = match.css(_SEL_TEAM)
             teams_info = [{
-                'name': team.find(class_='match-item-vs-team-name').get_text(strip=True),
-                'flag': get_flag_unicode(team.find('span').get('class')[1])
+                'name': sys.intern(team.css_first(_SEL_TEAM_NAME).text(strip=True)),
+                'flag': get_flag_unicode(team.css_first('span').attributes.get('class', '').split()[1])
             } for team in teams]
-            
+
             # Extract event information
-            event_info = match.find(class_='match-item-event').get_text().replace('\t', '').strip()
+            event_info = sys.intern(match.css_first(_SEL_EVENT).text().translate(_STRIP_TABS).strip())
 
-            # Add to match data cache
+            # Add to match data cache; the matchup string is rendered once
+            # here instead of at every embed build
             match_data.append({
                 'url': match_url,
                 'status': live_or_upcoming,
                 'eta': eta,
                 'teams': teams_info,
-                'event': event_info
+                'event': event_info,
+                'matchup': f"{teams_info[0]['flag']} {teams_info[0]['name']} vs. {teams_info[1]['flag']} {teams_info[1]['name']}"
             })
-        
-        # Push everything to config
-        await self.config.match_cache.set(match_data)
-        await self.config.cache_time.set(datetime.now(timezone.utc).isoformat())
 
-    async def _getresults(self):
-        """Parse results from vlr"""
+        return match_data
 
-        # Get HTML response for upcoming matches
-        url = "https://www.vlr.gg/matches/results"
-        response = requests.get(url)
-        # Handle non-200 response
-        if response.status_code != 200:
-            print(f"Error: {url} responded with {response.status_code}")
-            return
-        # Create soup
-        soup = BeautifulSoup(response.content, 'html.parser')
+    async def _getmatches(self):
+        """Parse matches from vlr
+
+        Returns the parsed list, None if the cached listing was revalidated
+        (304 or identical body), or _FETCH_FAILED on an unusable response.
+        """
 
-        # Find listed matches
-        matches = soup.find_all('a', class_=['wf-module-item', 'match-item'])
+        # Get HTML response for upcoming matches
+        url = "https://www.vlr.gg/matches"
+        async with self.session.get(url, headers=self._conditional_headers(url)) as response:
+            # Nothing changed since last poll, the cached listing is still valid
+            if response.status == 304:
+                return None
+            # Handle non-200 response
+            if response.status != 200:
+                log.warning("%s responded with %s", url, response.status)
+                return _FETCH_FAILED
+            # lexbor takes the raw bytes directly, no intermediate str copy
+            body = await response.read()
+
+        # Hash fallback: identical body without server validators, skip parse
+        if self._store_validators(url, response, body):
+            return None
+
+        # Listing pages are sizeable, parse off the event loop
+        return await asyncio.to_thread(self._parse_matches, body)
+
+    def _parse_results(self, body):
+        """ Pure sync parse of the results listing, safe for a thread """
+
+        # Parse with selectolax (C-backed, much faster than bs4's html.parser)
+        tree = LexborHTMLParser(body)
 
         match_data = []
-        for match in matches:
+        for match in tree.css(_SEL_MATCH_ITEM):
             # Extract the URL to the individual match page
-            match_url = self.BASE_URL + match.get('href')
-            
+            match_url = self.BASE_URL + match.attributes.get('href')
+
             # Check if the match is live or upcoming
-            eta = match.find(class_='ml-eta')
-            eta = eta.get_text(strip=True) if eta else None
-            
+            eta = match.css_first(_SEL_ETA)
+            eta = eta.text(strip=True) if eta else None
+
             # Extract participating teams and their flag emojis
-            teams = match.find_all(class_=['match-item-vs-team'])
+            teams = match.css(_SEL_TEAM)
             teams_info = [{
-                'score': int(team.find(class_=['match-item-vs-team-score']).get_text(strip=True)),
-                'name': team.find(class_='match-item-vs-team-name').get_text(strip=True),
-                'is_winner': 'mod-winner' in team.get('class', []),
-                'flag': get_flag_unicode(team.find('span').get('class')[1])
+                'score': int(team.css_first(_SEL_TEAM_SCORE).text(strip=True)),
+                'name': sys.intern(team.css_first(_SEL_TEAM_NAME).text(strip=True)),
+                'is_winner': 'mod-winner' in team.attributes.get('class', ''),
+                'flag': get_flag_unicode(team.css_first('span').attributes.get('class', '').split()[1])
             } for team in teams]
-            
+
             # Extract event information
-            event_info = match.find(class_='match-item-event').get_text().replace('\t', '').strip()
+            event_info = sys.intern(match.css_first(_SEL_EVENT).text().translate(_STRIP_TABS).strip())
 
-            # Add to result data cache
+            # Add to result data cache; the matchup string is rendered once
+            # here instead of at every embed build
             match_data.append({
                 'url': match_url,
                 'status': 'Completed',
                 'eta': eta,
                 'teams': teams_info,
-                'event': event_info
+                'event': event_info,
+                'matchup': f"{teams_info[0]['flag']} {teams_info[0]['name']} vs. {teams_info[1]['flag']} {teams_info[1]['name']}"
             })
-        
-        # Push everything to config
-        await self.config.result_cache.set(match_data)
-        await self.config.cache_time.set(datetime.now(timezone.utc).isoformat())
+
+        return match_data
+
+    async def _getresults(self):
+        """Parse results from vlr
+
+        Returns the parsed list, None if the cached listing was revalidated
+        (304 or identical body), or _FETCH_FAILED on an unusable response.
+        """
+
+        # Get HTML response for upcoming matches
+        url = "https://www.vlr.gg/matches/results"
+        async with self.session.get(url, headers=self._conditional_headers(url)) as response:
+            # Nothing changed since last poll, the cached listing is still valid
+            if response.status == 304:
+                return None
+            # Handle non-200 response
+            if response.status != 200:
+                log.warning("%s responded with %s", url, response.status)
+                return _FETCH_FAILED
+            # lexbor takes the raw bytes directly, no intermediate str copy
+            body = await response.read()
+
+        # Hash fallback: identical body without server validators, skip parse
+        if self._store_validators(url, response, body):
+            return None
+
+        # Listing pages are sizeable, parse off the event loop
+        return await asyncio.to_thread(self._parse_results, body)
+
+    async def _refresh_caches(self):
+        """ Fetch both listings concurrently and write config once """
+
+        match_data, result_data = await asyncio.gather(self._getmatches(), self._getresults())
+
+        # A failed fetch keeps the cached data but must not refresh its age;
+        # only a real 200 or a revalidating 304 proves the cache is current
+        fetch_ok = match_data is not _FETCH_FAILED and result_data is not _FETCH_FAILED
+        if match_data is _FETCH_FAILED:
+            match_data = None
+        if result_data is _FETCH_FAILED:
+            result_data = None
+
+        # A fresh 200 whose parsed rows equal the in-memory copy is still
+        # unchanged; don't serialize an identical list back through Config
+        if match_data is not None and match_data == self._match_cache_mem:
+            match_data = None
+        if result_data is not None and result_data == self._result_cache_mem:
+            result_data = None
+
+        # Track how long the listings have been answering 304s
+        if match_data is None and result_data is None:
+            self._unchanged_polls += 1
+        else:
+            self._unchanged_polls = 0
+
+        # None means unchanged/unavailable; keep whatever is cached
+        if match_data is not None:
+            await self.config.match_cache.set(match_data)
+            self._match_field_cache.clear()
+        if result_data is not None:
+            await self.config.result_cache.set(result_data)
+            self._result_field_cache.clear()
+        # One clock read backs both stamps so they can never disagree; a
+        # failed fetch keeps the old timestamp so the listing commands show
+        # how stale the data really is
+        if fetch_ok:
+            now = datetime.now(timezone.utc)
+            await self.config.cache_time.set(now.isoformat())
+            self._cache_time_epoch = now.timestamp()
+
+        # Rebuild in-memory copies and category views when either listing
+        # changed, or on the first refresh after a cog load; Config stays the
+        # persisted source of truth but the hot paths never deserialize it
+        if match_data is not None or result_data is not None or self._matches_by_cat is None:
+            if match_data is None:
+                match_data = await self.config.match_cache()
+            if result_data is None:
+                result_data = await self.config.result_cache()
+            self._match_cache_mem = match_data
+            self._result_cache_mem = result_data
+            self._build_category_views(match_data, result_data)
+
+    def _build_category_views(self, matches, results):
+        """ Partition both listing caches by command category once per refresh """
+        self._matches_by_cat = {'Valorant': matches}
+        self._results_by_cat = {'Valorant': results}
+        for cat, needle in _CATEGORY_FILTERS.items():
+            self._matches_by_cat[cat] = [m for m in matches if needle in m['event']]
+            self._results_by_cat[cat] = [m for m in results if needle in m['event']]
     
-    async def _getmatch(self, match_data: dict):
-        """ Helper function to get a single match's information """
+    def _parse_match_page(self, body: bytes):
+        """ Pure sync parse of a single match page, safe to run in a thread """
 
-        response = requests.get(match_data['url'])
-        # Handle non-200 response
-        if response.status_code != 200:
-            print(f"Error: {match_data['url']} responded with {response.status_code}")
-            return
-        # Create soup
-        soup = BeautifulSoup(response.content, 'html.parser')
+        tree = LexborHTMLParser(body)
+
+        # Every header lookup below walks just the header card, not the whole
+        # document (which is dominated by the stats tables)
+        header = tree.css_first('.match-header') or tree.root
 
         # Team information
         data = {'event': {}}
         teamA = {}
         teamB = {}
 
-        teamA['name'] = soup.find(class_=["match-header-link-name mod-1"]).get_text(strip=True)
-        teamB['name'] = soup.find(class_=["match-header-link-name mod-2"]).get_text(strip=True)
-        teamA['url'] = self.BASE_URL + soup.find('a', class_=["match-header-link wf-link-hover mod-1"])['href']
-        teamB['url'] = self.BASE_URL + soup.find('a', class_=["match-header-link wf-link-hover mod-2"])['href']
-        teamA['logo'] = "https:"+soup.find('a', class_=["match-header-link wf-link-hover mod-1"]).find('img')['src']
-        teamB['logo'] = "https:"+soup.find('a', class_=["match-header-link wf-link-hover mod-2"]).find('img')['src']
+        teamA['name'] = header.css_first('.match-header-link-name.mod-1').text(strip=True)
+        teamB['name'] = header.css_first('.match-header-link-name.mod-2').text(strip=True)
+        link_A = header.css_first('a.match-header-link.wf-link-hover.mod-1')
+        link_B = header.css_first('a.match-header-link.wf-link-hover.mod-2')
+        # urljoin handles relative, scheme-relative (//owcdn...), and already-
+        # absolute hrefs in one C-level call, replacing startswith+concat
+        teamA['url'] = urljoin(self.BASE_URL, link_A.attributes['href'])
+        teamB['url'] = urljoin(self.BASE_URL, link_B.attributes['href'])
+        teamA['logo'] = urljoin(self.BASE_URL, link_A.css_first('img').attributes['src'])
+        teamB['logo'] = urljoin(self.BASE_URL, link_B.css_first('img').attributes['src'])
 
         # Event information
-        event_info_div = soup.find(class_="match-header-event")
-        data['event']['info'] = event_info_div.get_text().replace('\t', '').replace('\n', ' ').strip()
-        
-        event_url = event_info_div['href']
-        event_url = self.BASE_URL + event_url if not event_url.startswith('http') else event_url
-        data['event']['url'] = event_url
+        event_info_div = header.css_first('.match-header-event')
+        data['event']['info'] = event_info_div.text().translate(_CLEAN_WS).strip()
+
+        data['event']['url'] = urljoin(self.BASE_URL, event_info_div.attributes['href'])
 
         # Find match format (e.g., BO1, BO3, BO5)
-        data['event']['datetime'] = soup.find(class_="match-header-date").get_text().replace('\t', '').replace('\n', ' ').strip()
-        data['event']['format'] = soup.find(class_="match-header-vs-note").get_text(strip=True)
+        data['event']['datetime'] = header.css_first('.match-header-date').text().translate(_CLEAN_WS).strip()
+        data['event']['format'] = header.css_first('.match-header-vs-note').text(strip=True)
 
         # Find players
         teamA['players'] = []
         teamB['players'] = []
 
-        team_tables = soup.find('div', class_="vm-stats-game", attrs={"data-game-id": 'all'})
-        team_tables = team_tables.find_all('tbody')
+        team_tables = tree.css_first('div.vm-stats-game[data-game-id="all"]').css('tbody')
 
         # Process each team table
         for team_index, team_table in enumerate(team_tables):
-            player_rows = team_table.find_all('tr')
+            player_rows = team_table.css('tr')
             for row in player_rows:
                 # Extract player name and URL
-                player_name_tag = row.find('a')
-                player_name = player_name_tag.get_text().split()[0]
-                player_url = player_name_tag['href']
+                player_name_tag = row.css_first('a')
+                player_name = player_name_tag.text().split()[0]
 
                 # Make URL absolute if necessary
-                player_url = self.BASE_URL + player_url if not player_url.startswith('http') else player_url
+                player_url = urljoin(self.BASE_URL, player_name_tag.attributes['href'])
 
                 # Extract flag emoji
-                flag_tag = row.find('i', class_='flag')
-                flag_cls = flag_tag.get('class')[1]
-                
+                flag_tag = row.css_first('i.flag')
+                flag_cls = flag_tag.attributes.get('class', '').split()[1]
+
                 player_info = {
                     'name': player_name,
                     'flag': get_flag_unicode(flag_cls),
@@ -555,11 +825,28 @@ class VLR(commands.Cog):
 
         data['teamA'] = teamA
         data['teamB'] = teamB
+        return data
+
+    async def _getmatch(self, match_data: dict):
+        """ Helper function to get a single match's information """
+
+        async with self._scrape_sem:
+            async with self.session.get(match_data['url']) as response:
+                # Handle non-200 response
+                if response.status != 200:
+                    log.warning("%s responded with %s", match_data['url'], response.status)
+                    return
+                # lexbor takes the raw bytes directly, no intermediate str copy
+                body = await response.read()
+
+        # Match pages are big; parse in a worker thread so the event loop
+        # stays free for other cogs
+        data = await asyncio.to_thread(self._parse_match_page, body)
 
         # Matchup String
         team_A = match_data['teams'][0]
         team_B = match_data['teams'][1]
-        data['matchup'] = f"{team_A['flag']} {team_A['name']} vs. {team_B['flag']} {team_B['name']}"
+        data['matchup'] = matchup_line(match_data)
         data['matchup_text'] = f"{team_A['name'].replace(' ', '-')}-vs-{team_B['name'].replace(' ', '-')}"
 
         data['timestamp'] = datetime.now(timezone.utc).isoformat()
@@ -568,31 +855,41 @@ class VLR(commands.Cog):
     async def _sendnotif(self):
         """Send out notifications for relevant matches"""
 
-        def sub_check(match, sub_event, sub_team):
+        def sub_check(match, event_re, sub_team_set):
             """Check if the match is subscribed to"""
-            subscribed = False
-            reason = ""
 
             # Substring match to find subscribed event
-            for se in sub_event:
-                if se in match['event']:
-                    subscribed = True
-                    reason = f"Event: {se}"
-                    break
-            
-            # Exact string match to find subscribed team
-            if not subscribed:
-                for st in sub_team:
-                    if st == match['teams'][0]['name'] or st == match['teams'][1]['name']:
-                        subscribed = True
-                        reason = f"Team: {st}"
-                        break
-            
-            return subscribed, reason
+            if event_re is not None:
+                found = event_re.search(match['event'])
+                if found:
+                    return True, f"Event: {found.group(0)}"
 
-        # Get matches
-        matches = await self.config.match_cache()
-        results = await self.config.result_cache()
+            # Exact string match to find subscribed team
+            for team in match['teams']:
+                if team['name'] in sub_team_set:
+                    return True, f"Team: {team['name']}"
+
+            return False, ""
+
+        # Get matches; in-memory copies when available, Config after a reload
+        matches = self._match_cache_mem if self._match_cache_mem is not None else await self.config.match_cache()
+        results = self._result_cache_mem if self._result_cache_mem is not None else await self.config.result_cache()
+
+        # Completed matches can't be notified again, drop their cached pages
+        result_urls = {r['url'] for r in results}
+        for key in [k for k in self._match_page_cache if k[0] in result_urls]:
+            del self._match_page_cache[key]
+
+        # Notifications and result sends are independent of each other, fan
+        # them out at the end
+        notify_tasks = []
+        result_tasks = []
+        # Share in-flight match-page fetches so a match subscribed in many
+        # guilds is only scraped once per tick
+        pending_fetches = {}
+        # Guilds on identical subscriptions (e.g. the defaults) share one
+        # sub_check result per match instead of re-scanning per guild
+        sub_memo = {}
 
         # Need to do this for each guild
         all_guilds = await self.config.all_guilds()
@@ -603,59 +900,179 @@ class VLR(commands.Cog):
             if channel_id is None:
                 continue
 
-            channel_obj = self.bot.get_channel(channel_id)
+            channel_obj = self._channel_cache.get(channel_id)
+            if channel_obj is None:
+                channel_obj = self.bot.get_channel(channel_id)
+                if channel_obj is None:
+                    # Channel no longer exists (or isn't visible), can't notify
+                    continue
+                self._channel_cache[channel_id] = channel_obj
             guild_obj = self.bot.get_guild(guild_id)
 
             sub_event = all_guilds[guild_id]['sub_event']
-            sub_team = all_guilds[guild_id]['sub_team']
+            sub_team_set = set(all_guilds[guild_id]['sub_team'])
             notify_lead = all_guilds[guild_id]['notify_lead']
-            notified_cache = all_guilds[guild_id]['notified']
+            notified_cache = set(all_guilds[guild_id]['notified'])
+
+            # Nothing subscribed and nothing outstanding: the guild can't
+            # produce a notification or a result this tick
+            if not sub_event and not sub_team_set and not notified_cache:
+                continue
+
+            event_re = _compile_sub_patterns(tuple(sub_event))
+            sub_key = (tuple(sub_event), frozenset(sub_team_set))
+
+            # No subscriptions means no match can qualify, skip the match loop
+            # (results below still flush anything previously notified)
+            matches_to_check = matches if sub_event or sub_team_set else []
+
+            for match in matches_to_check:
+                # Already notified, skip before any parsing work
+                if match['url'] in notified_cache:
+                    continue
 
-            for match in matches:
                 # For each match, check if it's time to send a notification
                 eta_min = str_to_min(match['eta'])
-                
+
                 # Notify if the eta is sooner than the lead time or if it's LIVE already
                 if eta_min <= notify_lead or match['status'] == 'LIVE':
                     # Check if we're subscribed to this match
-                    subscribed, reason = sub_check(match, sub_event, sub_team)
-                    # Notify if notification hasn't occurred yet, otherwise it's a duplicate
-                    if match['url'] not in notified_cache and subscribed:
-                        # This helper function also updates the notified cache
-                        await self._notify(guild_obj, channel_obj, match, reason)
+                    memo_key = (sub_key, match['url'])
+                    if memo_key not in sub_memo:
+                        sub_memo[memo_key] = sub_check(match, event_re, sub_team_set)
+                    subscribed, reason = sub_memo[memo_key]
+                    if subscribed:
+                        # Bookkeeping for sent notifications is batched below
+                        notify_tasks.append((guild_obj, match['url'], self._notify(guild_obj, channel_obj, match, reason, pending_fetches)))
                 
                 elif eta_min > notify_lead:
                     # Matches are sorted soonest to latest so we can break safely 
                     break
             
-            for result in results:
-                # Send if we sent a pre-match notification about this match
-                if result['url'] in notified_cache:
-                    await self._result(guild_obj, channel_obj, result)
+            # No outstanding notifications means no result can match; skip
+            # the O(results) scan entirely
+            if notified_cache:
+                for result in results:
+                    # Send if we sent a pre-match notification about this match
+                    if result['url'] in notified_cache:
+                        result_tasks.append((guild_obj, result['url'], self._result(guild_obj, channel_obj, result)))
+
+        # One concurrent wave; a failed send shouldn't sink the rest
+        sent_per_guild = {}
+        removed_per_guild = {}
+        if notify_tasks or result_tasks:
+            all_tasks = notify_tasks + result_tasks
+            outcomes = await asyncio.gather(*(coro for _, _, coro in all_tasks), return_exceptions=True)
+            for i, ((guild_obj, url, _), outcome) in enumerate(zip(all_tasks, outcomes)):
+                if isinstance(outcome, Exception):
+                    # Surface the failure; gather swallows it otherwise and a
+                    # guild with broken sends would fail silently forever
+                    log.warning("Notification send failed for guild %s (%s)",
+                                guild_obj.id, url, exc_info=outcome)
+                    continue
+                if outcome is None:
+                    continue
+                if i < len(notify_tasks):
+                    sent_per_guild.setdefault(guild_obj, []).append(outcome)
+                else:
+                    removed_per_guild.setdefault(guild_obj, []).append(outcome)
+
+        # Flush every guild's notified delta (sends and result removals) in
+        # one config write per guild
+        for guild_obj in sent_per_guild.keys() | removed_per_guild.keys():
+            async with self.config.guild(guild_obj).notified() as notified:
+                for url in removed_per_guild.get(guild_obj, []):
+                    if url in notified:
+                        notified.remove(url)
+                notified.extend(sent_per_guild.get(guild_obj, []))
+                # Rolling window; stale entries (e.g. cancelled matches)
+                # can't grow the list forever
+                del notified[:-200]
+
+    async def _notify_light(self, guild, channel, match_data, reason):
+        """ Lightweight notification built from listing data only, no scrape """
+
+        team_A = match_data['teams'][0]
+        team_B = match_data['teams'][1]
+        matchup = matchup_line(match_data)
+
+        # Create voice channel if enabled
+        vc_enabled = await self._vc_enabled(guild)
+        if vc_enabled:
+            matchup_text = f"{team_A['name'].replace(' ', '-')}-vs-{team_B['name'].replace(' ', '-')}"
+            created_vc = await self._create_vc(guild, match_data['url'], matchup_text)
+
+        # Build embed
+        embed = discord.Embed(
+            title=f"\N{BELL} Upcoming Match in {match_data['eta']}",
+            description=matchup,
+            color=_EMBED_COLOR,
+            url=match_data['url']
+        )
+
+        # Footer to explain why we're sending this notification
+        embed.set_footer(text=f"Subscribed to {reason}")
+        embed.add_field(name=match_data['event'], value=f"Rosters and format on [vlr.gg]({match_data['url']})", inline=False)
+
+        # Tag the voice channel where the watch party is happening if it's enabled
+        if vc_enabled:
+            embed.add_field(name="Watch Party", value=f"<#{created_vc.id}>", inline=False)
+
+        # Send embed
+        await channel.send(embed=embed, allowed_mentions=None)
+
+        # Notification successfully sent; caller batches the bookkeeping
+        return match_data['url']
+
+    async def _notify(self, guild, channel, match_data, reason, pending_fetches=None):
+        """ Helper function to send match notification
+
+        Returns the match URL on success so _sendnotif can batch the
+        notified-cache writes per guild.
+        """
+
+        # Far-out notifications don't need the full roster scrape; the listing
+        # row already carries teams, flags, and the event string
+        if match_data['status'] != 'LIVE' and str_to_min(match_data['eta']) > self.DETAIL_LEAD:
+            return await self._notify_light(guild, channel, match_data, reason)
 
-    async def _notify(self, guild, channel, match_data, reason):
-        """ Helper function to send match notification """
-        
         # We want to scrape the match page to get full player information
         # Get HTML response for upcoming matches
-        async with self.config.notify_cache() as notify_cache:
-            if match_data['url'] not in notify_cache:
-                print('cache missed')
-                full_data = await self._getmatch(match_data)
-                notify_cache[match_data['url']] = full_data
+        cache_key = (match_data['url'], match_data['status'])
+        entry = self._match_page_cache.get(cache_key)
+        if entry is None or entry[0] <= time.monotonic():
+            log.debug("Match page cache miss: %s", match_data['url'])
+            if pending_fetches is not None:
+                # Reuse an in-flight fetch if another guild already started one
+                task = pending_fetches.get(match_data['url'])
+                if task is None:
+                    task = asyncio.ensure_future(self._getmatch(match_data))
+                    pending_fetches[match_data['url']] = task
+                full_data = await task
             else:
-                print('cache hit')
-                full_data = notify_cache[match_data['url']]
+                full_data = await self._getmatch(match_data)
+            # Only cache successful scrapes; caching a None would turn
+            # every retry within the TTL into a hit that stays None
+            if full_data is not None:
+                self._match_page_cache[cache_key] = (time.monotonic() + self.MATCH_PAGE_TTL, full_data)
+        else:
+            log.debug("Match page cache hit: %s", match_data['url'])
+            full_data = entry[1]
 
-        # Create voice channel if enabled
-        if await self.config.guild(guild).vc_enabled():
+        # Scrape failed; leave the match unnotified so the next tick retries
+        if full_data is None:
+            return None
+
+        # Create voice channel if enabled; read the flag once and reuse below
+        vc_enabled = await self._vc_enabled(guild)
+        if vc_enabled:
             created_vc = await self._create_vc(guild, match_data['url'], full_data['matchup_text'])
 
         # Build embed
         embed = discord.Embed(
             title=f"\N{BELL} Upcoming Match in {match_data['eta']}",
             description=full_data['matchup'],
-            color=0xff4654,
+            color=_EMBED_COLOR,
             url=match_data['url']
         )
 
@@ -664,21 +1081,23 @@ class VLR(commands.Cog):
         embed.add_field(name=full_data['event']['info'], value=f"{full_data['event']['format']} | {full_data['event']['datetime']}", inline=False)
 
         # Team A information inline
-        teamA_name = full_data['teamA']['name']
-        teamA_val = f"\N{BUSTS IN SILHOUETTE} [Team]({full_data['teamA']['url']})"
-        for p in full_data['teamA']['players']:
-            teamA_val += f"\n{p['flag']} [{p['name']}]({p['url']})"
-        embed.add_field(name=teamA_name, value=teamA_val, inline=True)
+        teamA = full_data['teamA']
+        teamA_val = '\n'.join(
+            [f"\N{BUSTS IN SILHOUETTE} [Team]({teamA['url']})"]
+            + [f"{p['flag']} [{p['name']}]({p['url']})" for p in teamA['players']]
+        )
+        embed.add_field(name=teamA['name'], value=teamA_val, inline=True)
 
         # Team B information inline
-        teamB_name = full_data['teamB']['name']
-        teamB_val = f"\N{BUSTS IN SILHOUETTE} [Team]({full_data['teamB']['url']})"
-        for p in full_data['teamB']['players']:
-            teamB_val += f"\n{p['flag']} [{p['name']}]({p['url']})"
-        embed.add_field(name=teamB_name, value=teamB_val, inline=True)
+        teamB = full_data['teamB']
+        teamB_val = '\n'.join(
+            [f"\N{BUSTS IN SILHOUETTE} [Team]({teamB['url']})"]
+            + [f"{p['flag']} [{p['name']}]({p['url']})" for p in teamB['players']]
+        )
+        embed.add_field(name=teamB['name'], value=teamB_val, inline=True)
 
         # Tag the voice channel where the watch party is happening if it's enabled
-        if await self.config.guild(guild).vc_enabled():
+        if vc_enabled:
             embed.add_field(name="Watch Party", value=f"<#{created_vc.id}>", inline=False)
 
         # Team logo images
@@ -698,45 +1117,47 @@ class VLR(commands.Cog):
         # Send embed
         await channel.send(embeds=[embed, embed_aux], allowed_mentions=None)
 
-        # Update cache, notification successfully sent
-        async with self.config.guild(guild).notified() as notified:
-            notified.append(match_data['url'])
+        # Notification successfully sent; caller batches the bookkeeping
+        return match_data['url']
     
     async def _result(self, guild, channel, result_data):
-        """Helper function to send match result"""
+        """ Helper function to send match result
+
+        Returns the match URL on success so _sendnotif can batch the
+        notified-cache removals per guild.
+        """
 
         # Build embed
         # Matchup string
         team_A = result_data['teams'][0]
         team_B = result_data['teams'][1]
-        matchup = f"{team_A['flag']} {team_A['name']} vs. {team_B['flag']} {team_B['name']}"
+        matchup = matchup_line(result_data)
 
         # Embed object
         embed = discord.Embed(
             title=f"\N{WHITE HEAVY CHECK MARK} Match Complete",
             description=matchup,
-            color=0xff4654,
+            color=_EMBED_COLOR,
             url=result_data['url']
         )
 
         # Spoilered match result with trophy emoji
-        trophy = '\N{TROPHY}'
-        result = f"{trophy if team_A['is_winner'] else ''} {team_A['name']} {team_A['score']} : {team_B['score']} {team_B['name']} {trophy if team_B['is_winner'] else ''}"
+        idx = (team_A['is_winner'] << 1) | team_B['is_winner']
+        result = f"{_TROPHY_PRE[idx]}{team_A['name']} {team_A['score']} : {team_B['score']} {team_B['name']}{_TROPHY_SUF[idx]}"
         embed.add_field(name='Scoreline', value=f"||{result}||", inline=False)
         embed.add_field(name='Event', value=f"*{result_data['event']}*", inline=False)
 
         # Send embed
         await channel.send(embed=embed, allowed_mentions=None)
 
-        # Update cache, result successfully sent
-        async with self.config.guild(guild).notified() as notified:
-            notified.remove(result_data['url'])
-        
         # Delete voice channel if enabled
-        vc_enabled = await self.config.guild(guild).vc_enabled()
+        vc_enabled = await self._vc_enabled(guild)
         if vc_enabled:
             await self._delete_vc(guild, result_data['url'])
 
+        # Result successfully sent; caller batches the bookkeeping
+        return result_data['url']
+
 
     #####################
     # PARSING LOOP TASK #
@@ -745,16 +1166,21 @@ class VLR(commands.Cog):
     @tasks.loop(seconds=300)
     async def parse(self):
         """ Loop to check for matches from VLR """
-        await self._getmatches()
-        await self._getresults()
+        await self._refresh_caches()
         await self._sendnotif()
         await self._clear_notif_cache()
+        await self._adapt_interval()
 
     @parse.before_loop
     async def before_parse(self):
         # Don't start parsing until the bot is ready
         await self.bot.wait_until_ready()
 
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel):
+        """ Drop deleted channels from the resolved-channel cache """
+        self._channel_cache.pop(channel.id, None)
+
     @command_vlr.command(name='interval')
     @checks.is_owner()  # Because this is a global parameter
     async def vlr_interval(self, ctx: commands.Context, seconds: int = 300):
@@ -769,11 +1195,39 @@ class VLR(commands.Cog):
         """Force update matches from VLR."""
         # Useful if we missed a polling cycle due to VLR server error
         # Notifications can be sent because caching prevents duplicates
-        await self._getmatches()
-        await self._getresults()
+        await self._refresh_caches()
         await self._sendnotif()
         await self._clear_notif_cache()
         await ctx.send("Updated matches from VLR.")
+
+    async def _adapt_interval(self):
+        """ Adjust the polling interval to how soon the next match starts """
+
+        matches = self._match_cache_mem if self._match_cache_mem is not None else await self.config.match_cache()
+
+        # Live matches or an imminent start need tight polling for notifications
+        live = any(m['status'] == 'LIVE' for m in matches)
+        etas = [str_to_min(m['eta']) for m in matches if m['eta']]
+        next_eta = min(etas) if etas else None
+
+        # The largest lead time across guilds governs how early "imminent" is
+        all_guilds = await self.config.all_guilds()
+        lead = max([g['notify_lead'] for g in all_guilds.values()], default=15)
+
+        if live or (next_eta is not None and next_eta <= lead):
+            interval = max(60, self.POLLING_RATE // 5)
+        elif next_eta is not None and next_eta > 60:
+            # Nothing for at least an hour, relax
+            interval = self.POLLING_RATE * 3
+        elif self._unchanged_polls >= 2:
+            # Listings keep answering 304, stretch the interval a bit; the
+            # imminent branch above still snaps it back near match time
+            interval = min(self.POLLING_RATE * 2, 900)
+        else:
+            interval = self.POLLING_RATE
+
+        # Jitter desynchronizes polls from other bot instances scraping vlr.gg
+        self.parse.change_interval(seconds=interval + random.uniform(0, 15))
     
     # @command_vlr.command(name='debug')
     # @checks.is_owner()
@@ -792,15 +1246,10 @@ class VLR(commands.Cog):
 
     async def _clear_notif_cache(self):
         """ Periodically clear the notification cache to prevent it from growing too large """
-        async with self.config.notify_cache() as notify_cache:
-            # For each item in the notify_cache dictionary, check if the 'timestamp' is older than 24 hours
-            to_del = []
-            for key in notify_cache.keys():
-                if (datetime.now(timezone.utc) - datetime.fromisoformat(notify_cache[key]['timestamp'])).total_seconds() > 86400:
-                    to_del.append(key)
-
-            for key in to_del:
-                del notify_cache[key]
+        now = time.monotonic()
+        expired = [url for url, (expires_at, _) in self._match_page_cache.items() if expires_at <= now]
+        for url in expired:
+            del self._match_page_cache[url]
 
     ################
     # LIST MATCHES #
@@ -812,49 +1261,52 @@ class VLR(commands.Cog):
         # Don't print more than 20 matches at any point
         n = min(n, 20)
 
-        # Get match cache
-        matches = await self.config.match_cache()
-        cache_time = await self.config.cache_time()
-
-        # Get how long the cache was updated
-        cache_datetime = datetime.fromisoformat(cache_time)
-        now_datetime = datetime.now(timezone.utc)
-        delta = int((now_datetime - cache_datetime).total_seconds())
-
         # Couldn't find anything in the cache, forcing an update
-        if len(matches) == 0:
-            print("Vlr match cache unpopulated, hard pulling")
-            await self._getmatches()
-            matches = await self.config.match_cache()
-            cache_time = await self.config.cache_time()
-
-        # Filter matches depending on which major categories were requested 
-        if cond == "VCT":
-            matches = [m for m in matches if "Champions Tour" in m['event']]
-        elif cond == "Game Changers":
-            matches = [m for m in matches if "Game Changers" in m['event']]
-        
-        # Build embed
-        embed = discord.Embed(
-            title=f"Upcoming {cond} Matches",
-            description=f"Retrieved {delta // 60} min {delta % 60} sec ago.",
-            color=0xff4654
-        )
+        if self._matches_by_cat is None or len(self._matches_by_cat['Valorant']) == 0:
+            async with self._refresh_lock:
+                # Re-check: another command may have refreshed while we waited
+                if self._matches_by_cat is None or len(self._matches_by_cat['Valorant']) == 0:
+                    log.info("Vlr match cache unpopulated, hard pulling")
+                    await self._refresh_caches()
+
+        # Get how long ago the cache was updated; the in-memory epoch avoids
+        # ISO parsing, the persisted stamp only backs the first command after
+        # a cog load
+        if self._cache_time_epoch is not None:
+            delta = int(time.time() - self._cache_time_epoch)
+        else:
+            cache_datetime = datetime.fromisoformat(await self.config.cache_time())
+            delta = int((datetime.now(timezone.utc) - cache_datetime).total_seconds())
 
-        # New field for each match
+        # Categories are pre-partitioned at refresh time, no filtering here
+        matches = self._matches_by_cat[cond]
+
+        # One field dict per match; fields are rendered once per cache refresh
+        # and reused across commands until the cache is replaced
+        fields = []
         for match in matches[:n]:
-            if match['status'] == 'LIVE':
-                embed_name = "\N{LARGE RED CIRCLE} LIVE"
-            else:
-                embed_name = f"{match['status']} {match['eta']}"
-            team_A = match['teams'][0]
-            team_B = match['teams'][1]
-            matchup = f"{team_A['flag']} {team_A['name']} vs. {team_B['flag']} {team_B['name']}"
-            event = match['event']
+            field = self._match_field_cache.get(match['url'])
+            if field is None:
+                if match['status'] == 'LIVE':
+                    embed_name = "\N{LARGE RED CIRCLE} LIVE"
+                else:
+                    embed_name = f"{match['status']} {match['eta']}"
+                matchup = matchup_line(match)
+                event = match['event']
+
+                embed_value = f"[{matchup}]({match['url']})\n*{event}*"
+                field = {'name': embed_name, 'value': embed_value, 'inline': False}
+                self._match_field_cache[match['url']] = field
 
-            embed_value = f"[{matchup}]({match['url']})\n*{event}*"
+            fields.append(field)
 
-            embed.add_field(name=embed_name, value=embed_value, inline=False)
+        # Build the embed in one shot from the prebuilt field dicts
+        embed = discord.Embed.from_dict({
+            'title': f"Upcoming {cond} Matches",
+            'description': f"Retrieved {delta // 60} min {delta % 60} sec ago.",
+            'color': _EMBED_COLOR,
+            'fields': fields
+        })
 
         # Send embed
         await ctx.send(embed=embed, allowed_mentions=None)
@@ -903,51 +1355,56 @@ class VLR(commands.Cog):
         # Don't print more than 20 matches at any point
         n = min(n, 20)
 
-        # Get results cache
-        results = await self.config.result_cache()
-        cache_time = await self.config.cache_time()
-
-        # Get how long ago the cache was updated
-        cache_datetime = datetime.fromisoformat(cache_time)
-        now_datetime = datetime.now(timezone.utc)
-        delta = int((now_datetime - cache_datetime).total_seconds())
-
         # Couldn't find anything in the cache, forcing an update
-        if len(results) == 0:
-            print("Vlr match cache unpopulated, hard pulling")
-            await self._getresults()
-            results = await self.config.result_cache()
-            cache_time = await self.config.cache_time()
-        
-        # Filter results depending on which major categories were requested
-        if cond == "VCT":
-            results = [m for m in results if "Champions Tour" in m['event']]
-        elif cond == "Game Changers":
-            results = [m for m in results if "Game Changers" in m['event']]
-        
-        # Build embed
-        embed = discord.Embed(
-            title=f"Completed {cond} Matches",
-            description=f"Retrieved {delta // 60} min {delta % 60} sec ago.",
-            color=0xff4654
-        )
-
-        # New field for each result
-        for result_data in results[:n]:
-            embed_name = f"Started {result_data['eta']} ago"
-
-            team_A = result_data['teams'][0]
-            team_B = result_data['teams'][1]
-            matchup = f"{team_A['flag']} {team_A['name']} vs. {team_B['flag']} {team_B['name']}"
-            trophy = '\N{TROPHY}'
-            result = f"{trophy if team_A['is_winner'] else ''} {team_A['score']} : {team_B['score']} {trophy if team_B['is_winner'] else ''}"
-
-            event = result_data['event']
+        if self._results_by_cat is None or len(self._results_by_cat['Valorant']) == 0:
+            async with self._refresh_lock:
+                # Re-check: another command may have refreshed while we waited
+                if self._results_by_cat is None or len(self._results_by_cat['Valorant']) == 0:
+                    log.info("Vlr result cache unpopulated, hard pulling")
+                    await self._refresh_caches()
+
+        # Get how long ago the cache was updated; the in-memory epoch avoids
+        # ISO parsing, the persisted stamp only backs the first command after
+        # a cog load
+        if self._cache_time_epoch is not None:
+            delta = int(time.time() - self._cache_time_epoch)
+        else:
+            cache_datetime = datetime.fromisoformat(await self.config.cache_time())
+            delta = int((datetime.now(timezone.utc) - cache_datetime).total_seconds())
 
-            # Needs to be spoilered
-            embed_value = f"[{matchup}]({result_data['url']})\n||{result}||\n*{event}*"
+        # Categories are pre-partitioned at refresh time, no filtering here
+        results = self._results_by_cat[cond]
 
-            embed.add_field(name=embed_name, value=embed_value, inline=False)
+        # One field dict per result; fields are rendered once per cache refresh
+        # and reused across commands until the cache is replaced
+        fields = []
+        for result_data in results[:n]:
+            field = self._result_field_cache.get(result_data['url'])
+            if field is None:
+                embed_name = f"Started {result_data['eta']} ago"
+
+                team_A = result_data['teams'][0]
+                team_B = result_data['teams'][1]
+                matchup = matchup_line(result_data)
+                idx = (team_A['is_winner'] << 1) | team_B['is_winner']
+                result = f"{_TROPHY_PRE[idx]}{team_A['score']} : {team_B['score']}{_TROPHY_SUF[idx]}"
+
+                event = result_data['event']
+
+                # Needs to be spoilered
+                embed_value = f"[{matchup}]({result_data['url']})\n||{result}||\n*{event}*"
+                field = {'name': embed_name, 'value': embed_value, 'inline': False}
+                self._result_field_cache[result_data['url']] = field
+
+            fields.append(field)
+
+        # Build the embed in one shot from the prebuilt field dicts
+        embed = discord.Embed.from_dict({
+            'title': f"Completed {cond} Matches",
+            'description': f"Retrieved {delta // 60} min {delta % 60} sec ago.",
+            'color': _EMBED_COLOR,
+            'fields': fields
+        })
 
         # Send embed
         await ctx.send(embed=embed, allowed_mentions=None)
@@ -1,4 +1,5 @@
 import asyncio
+import heapq
 import re
 
 import discord
@@ -6,6 +7,29 @@ from redbot.core import Config, checks, commands
 from redbot.core.utils.predicates import ReactionPredicate
 from redbot.core.utils.menus import start_adding_reactions
 
+# Possible characters in wordle emoji grid, built once at import
+_WORDLE_CHARSET = frozenset({'\N{BLACK LARGE SQUARE}',
+                             '\N{WHITE LARGE SQUARE}',
+                             '\N{LARGE GREEN SQUARE}',
+                             '\N{LARGE YELLOW SQUARE}',
+                             '\N{LARGE ORANGE SQUARE}',
+                             '\N{LARGE BLUE SQUARE}'})
+
+# Deletion table for the grid check: translating a valid row with this
+# leaves an empty string, so no per-row set has to be allocated
+_GRID_TABLE = str.maketrans('', '', ''.join(_WORDLE_CHARSET))
+
+# Points per solve, indexed by attempts - 1: a first-guess solve gets 10,
+# the second gets 5, then one fewer per extra attempt
+_SCORES = (10, 5, 4, 3, 2, 1)
+
+# Cache-miss sentinel; None is a real cached value (no channel set)
+_UNSET = object()
+
+# Wordle verification regex, compiled once at import; [1-6] means any
+# match already has a sane attempt count
+_WORDLE_RE = re.compile(r"Wordle (\d{0,3},?\d{3}) ([1-6])\/6")
+
 
 class Wordle(commands.Cog):
     """Wordle cog to track statistics and streaks"""
@@ -15,11 +39,12 @@ class Wordle(commands.Cog):
         self.bot = bot
         self.config = Config.get_conf(self, identifier=13330085047676266, force_registration=True)
 
-        default_guild = {'channelid': None}
+        default_guild = {'channelid': None, 'last_parsed_msgid': None}
         self.config.register_guild(**default_guild)
 
         default_member = {
             'gameids': [],
+            'n_games': 0,
             'total_score': 0,
             'last_gameid': 0,
             'curr_streak': 0,
@@ -28,44 +53,67 @@ class Wordle(commands.Cog):
 
         self.config.register_member(**default_member)
 
-        # Wordle verification regex
-        self.w = re.compile(r"Wordle (\d{0,3},?\d{3}) (\d{1})\/6")
+        # Per-guild wordle channel IDs, so the message listener doesn't hit
+        # Config for every message; written through by wordlechannel
+        self._channel_cache = {}
+
+        # Seen gameids per (guild, member) as sets, so the duplicate check is
+        # a hash lookup instead of a scan of the full history list
+        self._gameid_sets = {}
+
+        # Pending acknowledgements per channel plus their flush tasks; a
+        # short window batches a flurry of results into one send
+        self._pending_acks = {}
+        self._ack_tasks = {}
+
+    async def _get_channel_id(self, guild):
+        """Cached lookup of a guild's wordle channel ID"""
+        try:
+            return self._channel_cache[guild.id]
+        except KeyError:
+            channelid = await self.config.guild(guild).channelid()
+            self._channel_cache[guild.id] = channelid
+            return channelid
 
     def _parse_message(self, message):
         """Parse message string and check if it's a valid wordle result"""
 
-        # Possible characters in wordle emoji grid
-        wordle_charset = {'\N{BLACK LARGE SQUARE}', \
-                          '\N{WHITE LARGE SQUARE}', \
-                          '\N{LARGE GREEN SQUARE}', \
-                          '\N{LARGE YELLOW SQUARE}',\
-                          '\N{LARGE ORANGE SQUARE}', \
-                          '\N{LARGE BLUE SQUARE}'}
+        # Raw content is a plain attribute; clean_content resolves every
+        # mention, and a result grid never contains any
+        content = message.content
+        if not content.startswith('Wordle '):
+            return None
+
+        # The attempts fraction sits within the header; one sliced
+        # substring check rejects "Wordle is fun" chatter before the split
+        if '/6' not in content[:20]:
+            return None
 
         # Split into lines
-        lines = message.clean_content.split('\n')
+        lines = content.split('\n')
 
         # Early exit for messages with less than 3 lines
         if len(lines) < 3:
             return None
 
-        # Parse first line 
-        match = self.w.match(lines[0])
+        # Bound the header length before paying for the regex engine
+        if len(lines[0]) > 32:
+            return None
+
+        # Parse first line
+        match = _WORDLE_RE.match(lines[0])
         if match is not None:
             gameid = int(match.groups()[0].replace(",", ""))
             attempts = int(match.groups()[1])
 
-            # Early exit if attempts don't make sense
-            if attempts > 6:
-                return None
-
             # Early exit for messages without requisite emoji rows
             if len(lines) < attempts+2:
                 return None
 
-            # Integrity check of emoji grid
+            # Integrity check of emoji grid; anything surviving the deletion
+            # table is a character that doesn't belong in a grid row
             for i in range(2, attempts+2):
-                if not set(lines[i]) <= wordle_charset:
+                if lines[i].translate(_GRID_TABLE):
                     return None
 
             # Passed, return game info
@@ -77,36 +125,39 @@ class Wordle(commands.Cog):
     async def _add_result(self, guild, author, gameid, attempts):
         """Add a user's wordle result to their record"""
 
-        # Get previous stats
-        prev = await self.config.member(author).all()
-
-        # Avoid duplicates
-        async with self.config.member(author).gameids() as gameids:
-            if gameid in gameids:
+        # One Config transaction covers the dedup check and every stat
+        # update, instead of a separate write per field
+        async with self.config.member(author).all() as data:
+            # Avoid duplicates; membership is tested against a cached set
+            # built once per member instead of scanning the stored list
+            key = (guild.id, author.id)
+            seen = self._gameid_sets.get(key)
+            if seen is None:
+                seen = set(data['gameids'])
+                self._gameid_sets[key] = seen
+            if gameid in seen:
                 return
-            else:
-                gameids.append(gameid)
+            seen.add(gameid)
+            self._apply_result(data, gameid, attempts)
+
+    @staticmethod
+    def _apply_result(data, gameid, attempts):
+        """Apply one deduplicated game result to a member stats dict in place"""
+
+        data['gameids'].append(gameid)
+        data['n_games'] += 1
 
         # Update score
-        if attempts == 1:
-            # First guess gets 10 points
-            add_score = 10
-        else:
-            # Second guess gets 5, third guess gets 4, etc.
-            add_score = 7 - attempts
-        await self.config.member(author).total_score.set(prev['total_score'] + add_score)
+        data['total_score'] += _SCORES[attempts-1]
 
-        if gameid - prev['last_gameid'] == 1:
-            await self.config.member(author).last_gameid.set(gameid)
-            await self.config.member(author).curr_streak.set(prev['curr_streak']+1)
+        if gameid - data['last_gameid'] == 1:
+            data['curr_streak'] += 1
         else:
-            await self.config.member(author).last_gameid.set(gameid)
-            await self.config.member(author).curr_streak.set(1)
+            data['curr_streak'] = 1
+        data['last_gameid'] = gameid
 
         # Update qty
-        newhist = prev['qty'].copy()
-        newhist[attempts-1] += 1
-        await self.config.member(author).set_raw('qty', value=newhist)
+        data['qty'][attempts-1] += 1
 
     @commands.command()
     async def wordlestats(self, ctx: commands.Context, member: discord.Member):
@@ -120,11 +171,14 @@ class Wordle(commands.Cog):
 
         memberstats = await self.config.member(member).all()
 
-        totalgames = len(memberstats['gameids'])
+        # Counter field; fall back to the list length for records written
+        # before n_games existed
+        totalgames = memberstats['n_games'] or len(memberstats['gameids'])
 
-        # Build embed
-        channelid = await self.config.guild(ctx.guild).channelid()
-        refchannel = ctx.guild.get_channel(channelid).mention if channelid is not None else "N/A"
+        # Build embed; mention syntax only needs the id, so no channel
+        # object has to be resolved
+        channelid = await self._get_channel_id(ctx.guild)
+        refchannel = f"<#{channelid}>" if channelid is not None else "N/A"
         embed = discord.Embed(
             title=f"{member.display_name}'s Wordle Statistics",
             description=f"Pulled from messages in {refchannel}",
@@ -139,19 +193,18 @@ class Wordle(commands.Cog):
 
         # Calculate values for histogram
         percs = [int((x/totalgames)*100) for x in memberstats['qty']]
-        histmax = max(memberstats['qty'])
+        # qty can be all zeroes on a legacy record whose totalgames came
+        # from the gameids fallback; clamp so the bar math can't divide by 0
+        histmax = max(memberstats['qty']) or 1
         histlens = [int((x/histmax)*10) for x in memberstats['qty']]
         histbars = ['\N{LARGE GREEN SQUARE}'*h for h in histlens]
 
-        # Build histogram
-        histogram = ""
-        histogram += f"{totalgames} recorded games\n"
-        histogram += f"1\N{COMBINING ENCLOSING KEYCAP} {histbars[0]} {memberstats['qty'][0]} ({percs[0]}%)\n"
-        histogram += f"2\N{COMBINING ENCLOSING KEYCAP} {histbars[1]} {memberstats['qty'][1]} ({percs[1]}%)\n"
-        histogram += f"3\N{COMBINING ENCLOSING KEYCAP} {histbars[2]} {memberstats['qty'][2]} ({percs[2]}%)\n"
-        histogram += f"4\N{COMBINING ENCLOSING KEYCAP} {histbars[3]} {memberstats['qty'][3]} ({percs[3]}%)\n"
-        histogram += f"5\N{COMBINING ENCLOSING KEYCAP} {histbars[4]} {memberstats['qty'][4]} ({percs[4]}%)\n"
-        histogram += f"6\N{COMBINING ENCLOSING KEYCAP} {histbars[5]} {memberstats['qty'][5]} ({percs[5]}%)\n"
+        # Build histogram with a single join instead of repeated concatenation
+        histogram = '\n'.join(
+            [f"{totalgames} recorded games"]
+            + [f"{i+1}\N{COMBINING ENCLOSING KEYCAP} {histbars[i]} {memberstats['qty'][i]} ({percs[i]}%)"
+               for i in range(6)]
+        )
 
         embed.add_field(name="Histogram", value=histogram)
         embed.add_field(name="Total Score", value=memberstats['total_score'], inline=False)
@@ -163,54 +216,63 @@ class Wordle(commands.Cog):
     async def wordletop(self, ctx: commands.Context):
         """Show the Wordle top-5 leaderboard for total points and average attempts per solve."""
 
-        # Get scores and sort them 
-        memberstats = await self.config.all_members(guild=ctx.guild)
+        # The member dump, channel lookup, and embed color are independent
+        # reads; overlap them instead of awaiting each in turn
+        memberstats, channelid, embed_color = await asyncio.gather(
+            self.config.all_members(guild=ctx.guild),
+            self._get_channel_id(ctx.guild),
+            self.bot.get_embed_color(ctx)
+        )
         members = memberstats.keys()
 
+        # Only the top 5 of each board are shown, so bounded heap selection
+        # replaces sorting every member
+
         # Total scores (higher=better)
-        scores = [{'member': m, 'total_score': memberstats[m]['total_score'], 'n_games': len(memberstats[m]['gameids'])} for m in members]
-        scores = sorted(scores, key=lambda d: d['total_score'], reverse=True)
+        scores = heapq.nlargest(
+            5,
+            ({'member': m, 'total_score': memberstats[m]['total_score'], 'n_games': memberstats[m]['n_games'] or len(memberstats[m]['gameids'])} for m in members),
+            key=lambda d: d['total_score']
+        )
 
         # Average attempts (lower=better)
-        avg_attempts = [{'member': m, 'avg_attempt': sum([q*s for q, s in zip(memberstats[m]['qty'], [1,2,3,4,5,6])]) / len(memberstats[m]['gameids'])} for m in members]
-        avg_attempts = sorted(avg_attempts, key=lambda d: d['avg_attempt'])
+        avg_attempts = heapq.nsmallest(
+            5,
+            ({'member': m, 'avg_attempt': sum([q*s for q, s in zip(memberstats[m]['qty'], [1,2,3,4,5,6])]) / (memberstats[m]['n_games'] or len(memberstats[m]['gameids']))} for m in members),
+            key=lambda d: d['avg_attempt']
+        )
 
         # Build total score leaderboard
         prefixes = [f"\N{FIRST PLACE MEDAL}", f"\N{SECOND PLACE MEDAL}", f"\N{THIRD PLACE MEDAL}", "4.", "5."]
-        leaderboard = ""
         if len(members) == 0:
             leaderboard = "No members found."
         else:
+            rows = []
             for i in range(min(5, len(members))):
                 this_member = ctx.guild.get_member(scores[i]['member'])
-                if this_member is None:
-                    # Member left the server
-                    leaderboard += f"{prefixes[i]} <unknown> ({scores[i]['total_score']} points, {scores[i]['n_games']} solves)\n"
-                else:
-                    leaderboard += f"{prefixes[i]} {this_member.mention} ({scores[i]['total_score']} points, {scores[i]['n_games']} solves)\n"
-        leaderboard = leaderboard.rstrip()
+                # Member may have left the server
+                mention = "<unknown>" if this_member is None else this_member.mention
+                rows.append(f"{prefixes[i]} {mention} ({scores[i]['total_score']} points, {scores[i]['n_games']} solves)")
+            leaderboard = '\n'.join(rows)
 
         # Build avg attempt leaderboard
-        avgboard = ""
         if len(members) == 0:
             avgboard = "No members found."
         else:
+            rows = []
             for i in range(min(5, len(members))):
                 this_member = ctx.guild.get_member(avg_attempts[i]['member'])
-                if this_member is None:
-                    # Member left the server
-                    avgboard += f"{prefixes[i]} <unknown> ({avg_attempts[i]['avg_attempt']:.2f} per solve)\n"
-                else:
-                    avgboard += f"{prefixes[i]} {this_member.mention} ({avg_attempts[i]['avg_attempt']:.2f} per solve)\n"
-        avgboard = avgboard.rstrip()
-
-        # Build embed
-        channelid = await self.config.guild(ctx.guild).channelid()
-        refchannel = ctx.guild.get_channel(channelid).mention if channelid is not None else "N/A"
+                # Member may have left the server
+                mention = "<unknown>" if this_member is None else this_member.mention
+                rows.append(f"{prefixes[i]} {mention} ({avg_attempts[i]['avg_attempt']:.2f} per solve)")
+            avgboard = '\n'.join(rows)
+
+        # Build embed; mention syntax only needs the id
+        refchannel = f"<#{channelid}>" if channelid is not None else "N/A"
         embed = discord.Embed(
             title=f"{ctx.guild.name} Wordle Leaderboard",
             description=f"Share your results in {refchannel}",
-            color=await self.bot.get_embed_color(ctx)
+            color=embed_color
         )
         embed.add_field(name="Total Points", value=leaderboard)
         embed.add_field(name="Average Attempts", value=avgboard, inline=True)
@@ -228,15 +290,19 @@ class Wordle(commands.Cog):
         """
         if channel is not None:
             await self.config.guild(ctx.guild).channelid.set(channel.id)
+            self._channel_cache[ctx.guild.id] = channel.id
             await ctx.send(f"Wordle channel has been set to {channel.mention}")
         else:
             await self.config.guild(ctx.guild).channelid.set(None)
+            self._channel_cache[ctx.guild.id] = None
             await ctx.send("Wordle channel has been cleared")
 
     @commands.command()
     @checks.mod_or_permissions(administrator=True)
-    async def wordlereparse(self, ctx: commands.Context, history_limit: int = 1000):
+    async def wordlereparse(self, ctx: commands.Context, history_limit: int = 1000, full: bool = False):
         """Reparse wordle results from channel history. Number specifies message limit.
+        By default only messages newer than the last reparse are read; pass
+        True as a second argument to wipe stats and rebuild from scratch.
         This might take a while for large channels.
         """
 
@@ -246,25 +312,91 @@ class Wordle(commands.Cog):
             await ctx.send("Set a wordle channel with !setwordlechannel first!")
             return
 
+        # The configured channel may have been deleted since it was set
+        channel = ctx.guild.get_channel(channelid)
+        if channel is None:
+            await ctx.send("The wordle channel no longer exists, set a new one with !setwordlechannel!")
+            return
+
         #Reaction poll
-        msg = await ctx.send(f"Reparse {history_limit} msgs in {ctx.guild.get_channel(channelid).mention}?")
+        msg = await ctx.send(f"Reparse {history_limit} msgs in {channel.mention}?")
         start_adding_reactions(msg, ReactionPredicate.YES_OR_NO_EMOJIS)
 
         pred = ReactionPredicate.yes_or_no(msg, ctx.author)
         await ctx.bot.wait_for("reaction_add", check=pred)
         if pred.result is True:
             await ctx.send("Starting reparse.")
-            # Clear existing data
-            await self.config.clear_all_members(guild=ctx.guild)
 
-            # Go through message history and reload results
-            channel = ctx.guild.get_channel(channelid)
-            async for message in channel.history(limit=history_limit, oldest_first=True):
+            after = None
+            if full:
+                # Clear existing data, including the cached dedup sets
+                await self.config.clear_all_members(guild=ctx.guild)
+                self._gameid_sets.clear()
+            else:
+                # Incremental pass: only walk messages newer than where the
+                # last reparse stopped
+                last_msgid = await self.config.guild(ctx.guild).last_parsed_msgid()
+                if last_msgid is not None:
+                    after = discord.Object(id=last_msgid)
+
+            # Collect parsed results from the history walk. A full walk goes
+            # newest-first so a limited pass covers the most recent messages;
+            # an incremental resume goes oldest-first from the cursor so that
+            # if the limit truncates the walk, the cursor only advances past
+            # messages actually processed and the next run picks up the rest
+            if after is not None:
+                history = channel.history(limit=history_limit, after=after, oldest_first=True)
+            else:
+                history = channel.history(limit=history_limit)
+            parsed = []
+            newest_msgid = None
+            async for message in history:
+                if newest_msgid is None or message.id > newest_msgid:
+                    newest_msgid = message.id
                 gameinfo = self._parse_message(message)
-
                 if gameinfo is not None:
-                    await self._add_result(message.guild, message.author, gameinfo[0], gameinfo[1])
-            
+                    parsed.append((message.author, gameinfo[0], gameinfo[1]))
+
+            # Streak math needs chronological order; gameids are monotonic,
+            # so a local sort restores it without oldest-first pagination
+            parsed.sort(key=lambda t: t[1])
+
+            # Aggregate results in memory, then write once per author
+            # instead of once per message
+            acc = {}
+            for author, gameid, attempts in parsed:
+                record = acc.get(author)
+                if record is None:
+                    if full:
+                        record = {
+                            'gameids': [],
+                            'n_games': 0,
+                            'total_score': 0,
+                            'last_gameid': 0,
+                            'curr_streak': 0,
+                            'qty': [0, 0, 0, 0, 0, 0]
+                        }
+                    else:
+                        # Carry over the stored record so existing games,
+                        # streaks, and dedup state stay intact
+                        record = await self.config.member(author).all()
+                    acc[author] = record
+                    self._gameid_sets[(ctx.guild.id, author.id)] = set(record['gameids'])
+
+                seen = self._gameid_sets[(ctx.guild.id, author.id)]
+                if gameid in seen:
+                    continue
+                seen.add(gameid)
+                self._apply_result(record, gameid, attempts)
+
+            for author, record in acc.items():
+                await self.config.member(author).set(record)
+
+            # Remember where this pass stopped so the next incremental run
+            # starts after it
+            if newest_msgid is not None:
+                await self.config.guild(ctx.guild).last_parsed_msgid.set(newest_msgid)
+
             await ctx.send(f"Wordle results successfully loaded.")
         else:
             await ctx.send("Nevermind then.")
@@ -279,8 +411,15 @@ class Wordle(commands.Cog):
         # Don't listen to DMs
         if message.guild is None: return
 
-        # Only listen to messages from set channel
-        if message.channel.id != await self.config.guild(message.guild).channelid(): return
+        # Only listen to messages from set channel; a warm cache means no
+        # coroutine is even created for the overwhelming miss case
+        channelid = self._channel_cache.get(message.guild.id, _UNSET)
+        if channelid is _UNSET:
+            channelid = await self._get_channel_id(message.guild)
+        if message.channel.id != channelid: return
+
+        # Chatter can't be a result; skip before clean_content is even built
+        if not message.content.startswith('Wordle'): return
 
         # Check if valid message
         gameinfo = self._parse_message(message)
@@ -288,21 +427,45 @@ class Wordle(commands.Cog):
             # Add result
             await self._add_result(message.guild, message.author, gameinfo[0], gameinfo[1])
 
-            # Notify user
-            if gameinfo[1] == 1:
-                await message.channel.send(
-                    f"Fantastic solve, {message.author.mention}!!! Updated stats."
-                )
-            if gameinfo[1] <= 3:
-                await message.channel.send(
-                    f"Great solve, {message.author.mention}! Updated stats."
-                )
-            elif gameinfo[1] < 6:
-                await message.channel.send(
-                    f"Nice solve, {message.author.mention}. Updated stats."
-                )
-            elif gameinfo[1] == 6:
-                await message.channel.send(
-                    f"Close call, {message.author.mention}. Updated stats."
+            # Queue the acknowledgement; results posted close together (the
+            # midnight rush) get merged into a single send
+            self._pending_acks.setdefault(message.channel.id, []).append(
+                (message.author.mention, gameinfo[1])
+            )
+            task = self._ack_tasks.get(message.channel.id)
+            if task is None or task.done():
+                self._ack_tasks[message.channel.id] = asyncio.create_task(
+                    self._flush_acks(message.channel)
                 )
 
+    @staticmethod
+    def _ack_line(mention, attempts):
+        """Build the congratulation line for one result"""
+        if attempts == 1:
+            return f"Fantastic solve, {mention}!!!"
+        elif attempts <= 3:
+            return f"Great solve, {mention}!"
+        elif attempts < 6:
+            return f"Nice solve, {mention}."
+        else:
+            return f"Close call, {mention}."
+
+    async def _flush_acks(self, channel):
+        """Send everything queued for a channel as one message"""
+        # Loop until the queue is drained: results that arrive while a send
+        # is in flight land after the pop, and the listener won't schedule a
+        # new task while this one is still running
+        while True:
+            # Give a burst of submissions a moment to pile up
+            await asyncio.sleep(0.6)
+            acks = self._pending_acks.pop(channel.id, [])
+            if not acks:
+                return
+            lines = [self._ack_line(mention, attempts) for mention, attempts in acks]
+            if len(lines) == 1:
+                # Usual case: one result, same single-line reply as before
+                await channel.send(f"{lines[0]} Updated stats.")
+            else:
+                lines.append("Updated stats.")
+                await channel.send('\n'.join(lines))
+